@@ -1,28 +1,397 @@
 """Arena PLM API client with session authentication."""
 
-import httpx
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
 from typing import Any
 
+import hishel
+import httpcore
+import httpx
+import orjson
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
 
-class ArenaClient:
-    """Client for Arena PLM REST API."""
+CACHE_DIR = Path.home() / ".cache" / "arena-mcp"
+SESSION_FILE = CACHE_DIR / "session.json"
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+
+
+def _make_private_dir(path: Path) -> None:
+    """Create a directory (mode 0700), tightening the mode if it already exists."""
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    os.chmod(path, 0o700)
+
+
+class _SessionlessSerializer(hishel.JSONSerializer):
+    """Serialize cached responses without the request's Arena session header."""
+
+    def dumps(
+        self,
+        response: httpcore.Response,
+        request: httpcore.Request,
+        metadata: hishel.Metadata,
+    ) -> str | bytes:
+        request = httpcore.Request(
+            method=request.method,
+            url=request.url,
+            headers=[(k, v) for k, v in request.headers if k.lower() != b"arena_session_id"],
+            extensions=request.extensions,
+        )
+        return super().dumps(response, request, metadata)
+
+
+@functools.lru_cache(maxsize=2048)
+def _wrap_wildcard(value: str) -> str:
+    """Wrap value with wildcards for partial matching if not already wildcarded."""
+    if "*" in value:
+        return value
+    return f"*{value}*"
+
+
+class _BaseArenaClient:
+    """Session, caching and request-building state shared by the sync and async clients."""
 
     BASE_URL = "https://api.arenasolutions.com/v1"
+    CACHE_TTL = 120.0
+    SEARCH_CACHE_TTL = 15.0
+    CATEGORY_CACHE_TTL = 3600.0
+    SESSION_IDLE_TIMEOUT = 90 * 60.0  # Arena ends sessions after 90 minutes without use
+    SESSION_REFRESH_MARGIN = 60.0
+    SESSION_SAVE_INTERVAL = 300.0  # How often to persist the session's last-use time
+    TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+    LIMITS = httpx.Limits(
+        max_keepalive_connections=32,
+        max_connections=64,
+        keepalive_expiry=60.0,
+    )
+    HTTP_MEMORY_CACHE_SIZE = 1024
+    # hishel storage classes matching the client's I/O model
+    _FILE_STORAGE: type = hishel.FileStorage
+    _MEMORY_STORAGE: type = hishel.InMemoryStorage
+
+    def __init__(
+        self,
+        session_file: Path | None = SESSION_FILE,
+        share_cache_with: "_BaseArenaClient | None" = None,
+    ) -> None:
+        """Create a client, reusing a persisted session if one exists.
 
-    def __init__(self) -> None:
+        Args:
+            session_file: Where to persist the session id (None disables persistence)
+            share_cache_with: Client whose response caches this one should share, so
+                that invalidate() on either clears both
+        """
         self._session_id: str | None = None
         self._workspace_id: int | None = None
-        self._http = httpx.Client(timeout=30.0)
+        self._session_email: str | None = None
+        self._last_used = 0.0
+        self._saved_last_used = 0.0
+        self._credentials: tuple[str, str, int | None] | None = None
+        self._session_file = session_file
+        if share_cache_with is None:
+            self._cache: TTLCache = TTLCache(maxsize=1024, ttl=self.CACHE_TTL)
+            self._search_cache: TTLCache = TTLCache(maxsize=256, ttl=self.SEARCH_CACHE_TTL)
+            self._category_cache: TTLCache = TTLCache(maxsize=64, ttl=self.CATEGORY_CACHE_TTL)
+            self._cache_lock = threading.Lock()
+            self._cache_group: list[_BaseArenaClient] = []
+        else:
+            self._cache = share_cache_with._cache
+            self._search_cache = share_cache_with._search_cache
+            self._category_cache = share_cache_with._category_cache
+            self._cache_lock = share_cache_with._cache_lock
+            self._cache_group = share_cache_with._cache_group
+        self._cache_group.append(self)
+        self._http_storage, self._http_cache_on_disk = self._make_http_storage()
+        self._load_session()
+
+    @staticmethod
+    def _http_cache_controller() -> hishel.Controller:
+        """HTTP cache policy: reuse GET responses per Arena's Cache-Control/ETag headers.
+
+        Stale entries are revalidated with a conditional GET rather than served as-is.
+        """
+        return hishel.Controller(cacheable_methods=["GET"])
+
+    def _make_http_storage(self) -> tuple[Any, bool]:
+        """Create the HTTP cache storage, on disk if possible, and report which it is.
+
+        The on-disk cache holds PLM data, so its directories are private to this user.
+        If they can't be created, responses are cached in memory instead.
+        """
+        try:
+            _make_private_dir(CACHE_DIR)
+            _make_private_dir(HTTP_CACHE_DIR)
+            storage = self._FILE_STORAGE(serializer=_SessionlessSerializer(), base_path=HTTP_CACHE_DIR)
+        except OSError as e:
+            logger.warning(f"Caching Arena responses in memory; cannot use {HTTP_CACHE_DIR}: {e}")
+            return self._MEMORY_STORAGE(capacity=self.HTTP_MEMORY_CACHE_SIZE), False
+        return storage, True
+
+    def _clear_http_cache(self) -> None:
+        """Delete every response in the HTTP cache."""
+        if not self._http_cache_on_disk:
+            # hishel's in-memory storage has no clear(), so swap in an empty LFU cache
+            self._http_storage._cache = hishel.LFUCache(capacity=self.HTTP_MEMORY_CACHE_SIZE)
+            return
+        try:
+            for path in HTTP_CACHE_DIR.iterdir():
+                if path.name != ".gitignore":
+                    path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not clear Arena HTTP cache {HTTP_CACHE_DIR}: {e}")
 
     @property
     def is_authenticated(self) -> bool:
         return self._session_id is not None
 
+    @property
+    def session_expiring(self) -> bool:
+        """Whether the session is missing or within a minute of Arena's idle timeout."""
+        if self._session_id is None:
+            return True
+        idle = time.time() - self._last_used
+        return idle > self.SESSION_IDLE_TIMEOUT - self.SESSION_REFRESH_MARGIN
+
     def _headers(self) -> dict[str, str]:
-        headers = {"Content-Type": "application/json"}
         if self._session_id:
-            headers["arena_session_id"] = self._session_id
-        return headers
+            return {"arena_session_id": self._session_id}
+        return {}
+
+    def set_credentials(self, email: str, password: str, workspace_id: int | None = None) -> None:
+        """Remember credentials for re-login when the session expires.
+
+        A persisted session belonging to a different account or workspace is discarded,
+        along with every cached response.
+
+        Args:
+            email: User email address
+            password: User password
+            workspace_id: Optional workspace ID to use
+        """
+        self._credentials = (email, password, workspace_id)
+        if self._session_id and (
+            self._session_email != email
+            or (workspace_id and self._workspace_id != workspace_id)
+        ):
+            self._clear_session()
+            self.invalidate()
+
+    @staticmethod
+    def _login_payload(email: str, password: str, workspace_id: int | None) -> dict[str, Any]:
+        payload: dict[str, Any] = {"email": email, "password": password}
+        if workspace_id:
+            payload["workspaceId"] = workspace_id
+        return payload
+
+    def _start_session(
+        self,
+        data: dict[str, Any],
+        email: str,
+        password: str,
+        workspace_id: int | None,
+    ) -> None:
+        """Record a successful login response and persist the new session.
+
+        In-process cached responses are dropped, since they may belong to the previous
+        session. The HTTP cache revalidates its entries, so it is only cleared when the
+        login switches to a different account or workspace.
+        """
+        new_workspace_id = data.get("workspaceId")
+        switched = self._session_email is not None and (
+            self._session_email != email or self._workspace_id != new_workspace_id
+        )
+        self._credentials = (email, password, workspace_id)
+        self._session_id = data["arenaSessionId"]
+        self._workspace_id = new_workspace_id
+        self._session_email = email
+        self._last_used = time.time()
+        self._save_session()
+        if switched:
+            self.invalidate()
+        else:
+            self._drop_cached()
+
+    def _load_session(self) -> None:
+        """Restore a session persisted by a previous process, if any."""
+        if self._session_file is None:
+            return
+        try:
+            data = orjson.loads(self._session_file.read_bytes())
+            if not isinstance(data, dict):
+                raise ValueError("expected a JSON object")
+            session_id = data["session_id"]
+            last_used = data.get("last_used", 0.0)
+            if not isinstance(session_id, str):
+                raise ValueError("session_id is not a string")
+            if isinstance(last_used, bool) or not isinstance(last_used, (int, float)):
+                raise ValueError("last_used is not a number")
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable Arena session file {self._session_file}: {e}")
+            return
+        self._session_id = session_id
+        self._workspace_id = data.get("workspace_id")
+        self._session_email = data.get("email")
+        self._last_used = self._saved_last_used = float(last_used)
+
+    def _save_session(self) -> None:
+        """Persist the current session id (mode 0600) for reuse across restarts."""
+        if self._session_file is None:
+            return
+        self._saved_last_used = self._last_used
+        data = {
+            "session_id": self._session_id,
+            "workspace_id": self._workspace_id,
+            "email": self._session_email,
+            "last_used": self._last_used,
+        }
+        try:
+            _make_private_dir(self._session_file.parent)
+            fd = os.open(self._session_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(data))
+        except OSError as e:
+            logger.warning(f"Could not persist Arena session to {self._session_file}: {e}")
+
+    def _touch_session(self) -> None:
+        """Record that Arena just accepted the session.
+
+        The last-use time is re-persisted every few minutes, so a restarted process
+        can tell whether the saved session is still within Arena's idle timeout.
+        """
+        self._last_used = time.time()
+        if self._session_id and self._last_used - self._saved_last_used > self.SESSION_SAVE_INTERVAL:
+            self._save_session()
+
+    def _clear_session(self) -> None:
+        """Forget the current session, including the persisted copy."""
+        self._session_id = None
+        self._workspace_id = None
+        self._session_email = None
+        self._last_used = 0.0
+        if self._session_file is not None:
+            try:
+                self._session_file.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Could not remove Arena session file {self._session_file}: {e}")
+
+    def _require_credentials(self) -> tuple[str, str, int | None]:
+        if self._credentials is None:
+            raise RuntimeError("Not authenticated. Call login() first.")
+        return self._credentials
+
+    @staticmethod
+    def _decode(response: httpx.Response) -> dict[str, Any]:
+        """Parse a JSON response body with orjson (BOM and search payloads can be large)."""
+        return orjson.loads(response.content)
+
+    @staticmethod
+    def _cache_key(path: str, params: dict[str, Any] | None) -> tuple:
+        return (path, tuple(sorted((params or {}).items())))
+
+    def _cache_lookup(self, cache: TTLCache, key: tuple) -> dict[str, Any] | None:
+        with self._cache_lock:
+            return cache.get(key)
+
+    def _cache_store(self, cache: TTLCache, key: tuple, data: dict[str, Any]) -> None:
+        with self._cache_lock:
+            cache[key] = data
+
+    def invalidate(self, guid: str | None = None) -> None:
+        """Drop cached responses for an item, or all cached responses.
+
+        The on-disk HTTP cache is keyed by hashed URL, so it is cleared in full either way.
+        Clients sharing this one's caches are invalidated too.
+
+        Args:
+            guid: Item GUID to invalidate; clears the whole cache if omitted
+        """
+        for client in self._cache_group:
+            client._clear_http_cache()
+        self._drop_cached(guid)
+
+    def _drop_cached(self, guid: str | None = None) -> None:
+        """Drop in-process cached responses for an item, or all of them."""
+        with self._cache_lock:
+            self._search_cache.clear()
+            if guid is None:
+                self._cache.clear()
+                self._category_cache.clear()
+                return
+            prefix = f"/items/{guid}"
+            stale = [
+                key for key in self._cache
+                if key[0] == prefix or key[0].startswith(f"{prefix}/")
+            ]
+            for key in stale:
+                self._cache.pop(key, None)
+
+    @staticmethod
+    def _search_params(
+        name: str | None,
+        number: str | None,
+        description: str | None,
+        category_guid: str | None,
+        limit: int,
+        offset: int,
+    ) -> dict[str, Any]:
+        filters = (
+            ("name", name and _wrap_wildcard(name)),
+            ("number", number and _wrap_wildcard(number)),
+            ("description", description and _wrap_wildcard(description)),
+            ("category.guid", category_guid),
+        )
+        return {"limit": limit, "offset": offset, **{k: v for k, v in filters if v}}
+
+    @staticmethod
+    def _item_params(include_empty_attributes: bool) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if include_empty_attributes:
+            params["includeEmptyAdditionalAttributes"] = "true"
+        return params
+
+    @staticmethod
+    def _bom_params(include_additional_attributes: bool) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if include_additional_attributes:
+            params["includeAdditionalAttributes"] = "true"
+        return params
+
+    @staticmethod
+    def _category_params(path: str | None) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if path:
+            params["path"] = path
+        return params
+
+
+class ArenaClient(_BaseArenaClient):
+    """Client for Arena PLM REST API."""
+
+    def __init__(
+        self,
+        session_file: Path | None = SESSION_FILE,
+        share_cache_with: _BaseArenaClient | None = None,
+    ) -> None:
+        super().__init__(session_file, share_cache_with)
+        self._http = hishel.CacheClient(
+            storage=self._http_storage,
+            controller=self._http_cache_controller(),
+            base_url=self.BASE_URL,
+            http2=True,
+            timeout=self.TIMEOUT,
+            limits=self.LIMITS,
+            headers={"Content-Type": "application/json"},
+        )
+        self._login_lock = threading.Lock()
 
     def login(self, email: str, password: str, workspace_id: int | None = None) -> dict[str, Any]:
         """Authenticate with Arena API and establish session.
@@ -38,53 +407,78 @@ class ArenaClient:
         Raises:
             httpx.HTTPStatusError: If login fails
         """
-        payload: dict[str, Any] = {"email": email, "password": password}
-        if workspace_id:
-            payload["workspaceId"] = workspace_id
-
-        response = self._http.post(
-            f"{self.BASE_URL}/login",
-            json=payload,
-            headers={"Content-Type": "application/json"},
-        )
+        payload = self._login_payload(email, password, workspace_id)
+        response = self._http.post("/login", content=orjson.dumps(payload))
         response.raise_for_status()
 
-        data = response.json()
-        self._session_id = data["arenaSessionId"]
-        self._workspace_id = data.get("workspaceId")
+        data = self._decode(response)
+        self._start_session(data, email, password, workspace_id)
         return data
 
     def logout(self) -> None:
         """End the current session."""
         if self._session_id:
-            self._http.put(f"{self.BASE_URL}/logout", headers=self._headers())
-            self._session_id = None
-            self._workspace_id = None
-
-    def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
-        """Make an authenticated request, clearing session on 401."""
+            self._http.put("/logout", headers=self._headers())
+            self._clear_session()
+
+    def _relogin(self) -> None:
+        """Log in again with the remembered credentials."""
+        email, password, workspace_id = self._require_credentials()
+        self.login(email=email, password=password, workspace_id=workspace_id)
+
+    def _refresh_session(self, stale_session_id: str | None) -> None:
+        """Replace a missing or rejected session, logging in once across threads."""
+        with self._login_lock:
+            if self._session_id != stale_session_id:
+                return  # Another thread already logged in
+            self._clear_session()
+            self._relogin()
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Make an authenticated request, re-logging in once on 401."""
         self._ensure_authenticated()
-        kwargs.setdefault("headers", self._headers())
-        response = self._http.request(method, url, **kwargs)
+        headers = self._headers()
+        response = self._http.request(method, path, headers=headers, **kwargs)
         if response.status_code == 401:
-            self._session_id = None
-            self._workspace_id = None
+            if self._credentials is None:
+                self._clear_session()
+            else:
+                self._refresh_session(headers.get("arena_session_id"))
+                response = self._http.request(method, path, headers=self._headers(), **kwargs)
+        self._touch_session()
         response.raise_for_status()
         return response
 
+    def _cached_get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        cache: TTLCache | None = None,
+    ) -> dict[str, Any]:
+        """GET a JSON resource, serving repeat requests from a TTL cache.
+
+        Cached responses are shared between callers and must not be mutated.
+        """
+        if cache is None:
+            cache = self._cache
+        key = self._cache_key(path, params)
+
+        data = self._cache_lookup(cache, key)
+        if data is not None:
+            return data
+
+        data = self._decode(self._request("GET", path, params=params))
+        self._cache_store(cache, key, data)
+        return data
+
     def _ensure_authenticated(self) -> None:
-        """Raise if not authenticated."""
-        if not self.is_authenticated:
-            raise RuntimeError("Not authenticated. Call login() first.")
+        """Log in with remembered credentials if needed, raising if there are none.
 
-    @staticmethod
-    def _wrap_wildcard(value: str | None) -> str | None:
-        """Wrap value with wildcards for partial matching if not already wildcarded."""
-        if value is None:
-            return None
-        if "*" in value:
-            return value
-        return f"*{value}*"
+        A session about to hit Arena's idle timeout is replaced up front, so a long
+        batch doesn't stall on a 401 and re-login partway through.
+        """
+        if self.session_expiring:
+            self._refresh_session(self._session_id)
 
     def search_items(
         self,
@@ -112,18 +506,8 @@ class ArenaClient:
             RuntimeError: If not authenticated
             httpx.HTTPStatusError: If request fails
         """
-        params: dict[str, Any] = {"limit": limit, "offset": offset}
-        if name:
-            params["name"] = self._wrap_wildcard(name)
-        if number:
-            params["number"] = self._wrap_wildcard(number)
-        if description:
-            params["description"] = self._wrap_wildcard(description)
-        if category_guid:
-            params["category.guid"] = category_guid
-
-        response = self._request("GET", f"{self.BASE_URL}/items", params=params)
-        return response.json()
+        params = self._search_params(name, number, description, category_guid, limit, offset)
+        return self._cached_get("/items", params, cache=self._search_cache)
 
     def get_item(
         self,
@@ -143,12 +527,7 @@ class ArenaClient:
             RuntimeError: If not authenticated
             httpx.HTTPStatusError: If request fails
         """
-        params: dict[str, Any] = {}
-        if include_empty_attributes:
-            params["includeEmptyAdditionalAttributes"] = "true"
-
-        response = self._request("GET", f"{self.BASE_URL}/items/{guid}", params=params)
-        return response.json()
+        return self._cached_get(f"/items/{guid}", self._item_params(include_empty_attributes))
 
     def get_item_bom(
         self,
@@ -168,12 +547,7 @@ class ArenaClient:
             RuntimeError: If not authenticated
             httpx.HTTPStatusError: If request fails
         """
-        params: dict[str, Any] = {}
-        if include_additional_attributes:
-            params["includeAdditionalAttributes"] = "true"
-
-        response = self._request("GET", f"{self.BASE_URL}/items/{guid}/bom", params=params)
-        return response.json()
+        return self._cached_get(f"/items/{guid}/bom", self._bom_params(include_additional_attributes))
 
     def get_item_where_used(self, guid: str) -> dict[str, Any]:
         """Get assemblies where this item is used.
@@ -188,8 +562,7 @@ class ArenaClient:
             RuntimeError: If not authenticated
             httpx.HTTPStatusError: If request fails
         """
-        response = self._request("GET", f"{self.BASE_URL}/items/{guid}/whereused")
-        return response.json()
+        return self._cached_get(f"/items/{guid}/whereused")
 
     def get_item_revisions(self, guid: str) -> dict[str, Any]:
         """Get all revisions for an item.
@@ -205,8 +578,7 @@ class ArenaClient:
             RuntimeError: If not authenticated
             httpx.HTTPStatusError: If request fails
         """
-        response = self._request("GET", f"{self.BASE_URL}/items/{guid}/revisions")
-        return response.json()
+        return self._cached_get(f"/items/{guid}/revisions")
 
     def get_item_files(self, guid: str) -> dict[str, Any]:
         """Get files associated with an item.
@@ -221,8 +593,7 @@ class ArenaClient:
             RuntimeError: If not authenticated
             httpx.HTTPStatusError: If request fails
         """
-        response = self._request("GET", f"{self.BASE_URL}/items/{guid}/files")
-        return response.json()
+        return self._cached_get(f"/items/{guid}/files")
 
     def get_item_sourcing(
         self,
@@ -244,10 +615,7 @@ class ArenaClient:
             RuntimeError: If not authenticated
             httpx.HTTPStatusError: If request fails
         """
-        params: dict[str, Any] = {"limit": limit, "offset": offset}
-
-        response = self._request("GET", f"{self.BASE_URL}/items/{guid}/sourcing", params=params)
-        return response.json()
+        return self._cached_get(f"/items/{guid}/sourcing", {"limit": limit, "offset": offset})
 
     def get_categories(self, path: str | None = None) -> dict[str, Any]:
         """Get item categories.
@@ -262,13 +630,270 @@ class ArenaClient:
             RuntimeError: If not authenticated
             httpx.HTTPStatusError: If request fails
         """
-        params: dict[str, Any] = {}
-        if path:
-            params["path"] = path
-
-        response = self._request("GET", f"{self.BASE_URL}/settings/items/categories", params=params)
-        return response.json()
+        return self._cached_get(
+            "/settings/items/categories", self._category_params(path), cache=self._category_cache
+        )
 
     def close(self) -> None:
         """Close the HTTP client."""
         self._http.close()
+
+
+class AsyncArenaClient(_BaseArenaClient):
+    """Async client for Arena PLM REST API, for issuing requests concurrently.
+
+    Mirrors ArenaClient; see its methods for argument and return details.
+    """
+
+    # Max search pages fetched at once by search_all_items
+    PAGE_CONCURRENCY = 8
+    _FILE_STORAGE = hishel.AsyncFileStorage
+    _MEMORY_STORAGE = hishel.AsyncInMemoryStorage
+
+    def __init__(
+        self,
+        session_file: Path | None = SESSION_FILE,
+        share_cache_with: _BaseArenaClient | None = None,
+    ) -> None:
+        super().__init__(session_file, share_cache_with)
+        self._http = hishel.AsyncCacheClient(
+            storage=self._http_storage,
+            controller=self._http_cache_controller(),
+            base_url=self.BASE_URL,
+            http2=True,
+            timeout=self.TIMEOUT,
+            limits=self.LIMITS,
+            headers={"Content-Type": "application/json"},
+        )
+        self._login_lock = asyncio.Lock()
+        self._inflight: dict[tuple, asyncio.Task] = {}
+
+    async def login(
+        self,
+        email: str,
+        password: str,
+        workspace_id: int | None = None,
+    ) -> dict[str, Any]:
+        """Authenticate with Arena API and establish session."""
+        payload = self._login_payload(email, password, workspace_id)
+        response = await self._http.post("/login", content=orjson.dumps(payload))
+        response.raise_for_status()
+
+        data = self._decode(response)
+        self._start_session(data, email, password, workspace_id)
+        return data
+
+    async def logout(self) -> None:
+        """End the current session."""
+        if self._session_id:
+            await self._http.put("/logout", headers=self._headers())
+            self._clear_session()
+
+    async def _relogin(self) -> None:
+        """Log in again with the remembered credentials."""
+        email, password, workspace_id = self._require_credentials()
+        await self.login(email=email, password=password, workspace_id=workspace_id)
+
+    async def _refresh_session(self, stale_session_id: str | None) -> None:
+        """Replace a missing or rejected session, logging in once across tasks."""
+        async with self._login_lock:
+            if self._session_id != stale_session_id:
+                return  # Another task already logged in
+            self._clear_session()
+            await self._relogin()
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Make an authenticated request, re-logging in once on 401."""
+        if self.session_expiring:
+            await self._refresh_session(self._session_id)
+        headers = self._headers()
+        response = await self._http.request(method, path, headers=headers, **kwargs)
+        if response.status_code == 401:
+            if self._credentials is None:
+                self._clear_session()
+            else:
+                await self._refresh_session(headers.get("arena_session_id"))
+                response = await self._http.request(method, path, headers=self._headers(), **kwargs)
+        self._touch_session()
+        response.raise_for_status()
+        return response
+
+    async def _cached_get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        cache: TTLCache | None = None,
+    ) -> dict[str, Any]:
+        """GET a JSON resource, serving repeat requests from a TTL cache.
+
+        Concurrent requests for the same resource share a single round trip. The
+        fetch runs as its own task, so cancelling one caller doesn't cancel it for
+        the others.
+        """
+        if cache is None:
+            cache = self._cache
+        key = self._cache_key(path, params)
+
+        data = self._cache_lookup(cache, key)
+        if data is not None:
+            return data
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(path, params, cache, key))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._fetch_done, key))
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        cache: TTLCache,
+        key: tuple,
+    ) -> dict[str, Any]:
+        data = self._decode(await self._request("GET", path, params=params))
+        self._cache_store(cache, key, data)
+        return data
+
+    def _fetch_done(self, key: tuple, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved in case every caller was cancelled
+
+    async def search_items(
+        self,
+        name: str | None = None,
+        number: str | None = None,
+        description: str | None = None,
+        category_guid: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Search for items in Arena."""
+        params = self._search_params(name, number, description, category_guid, limit, offset)
+        return await self._cached_get("/items", params, cache=self._search_cache)
+
+    async def search_all_items(
+        self,
+        name: str | None = None,
+        number: str | None = None,
+        description: str | None = None,
+        category_guid: str | None = None,
+        page_size: int = 400,
+        max_items: int | None = None,
+    ) -> dict[str, Any]:
+        """Search for every matching item, beyond the per-request result limit.
+
+        The first page reports the total count; the remaining pages are then
+        fetched concurrently.
+
+        Args:
+            name: Filter by item name (partial match, wildcards added automatically)
+            number: Filter by item number (partial match, wildcards added automatically)
+            description: Filter by description (partial match, wildcards added automatically)
+            category_guid: Filter by category GUID (exact match)
+            page_size: Items per request (max 400)
+            max_items: Stop after this many items
+
+        Returns:
+            Arena-style results: "count" is the total number of matching items, which
+            exceeds len(results) when max_items cut the search short
+
+        Raises:
+            RuntimeError: If not authenticated
+            httpx.HTTPStatusError: If request fails
+        """
+        filters = {
+            "name": name,
+            "number": number,
+            "description": description,
+            "category_guid": category_guid,
+        }
+        first = await self.search_items(limit=page_size, offset=0, **filters)
+        count = first.get("count", 0)
+        total = count if max_items is None else min(count, max_items)
+
+        semaphore = asyncio.Semaphore(self.PAGE_CONCURRENCY)
+
+        async def fetch_page(offset: int) -> dict[str, Any]:
+            async with semaphore:
+                return await self.search_items(limit=page_size, offset=offset, **filters)
+
+        pages = await asyncio.gather(
+            *(fetch_page(offset) for offset in range(page_size, total, page_size))
+        )
+
+        results = [item for page in (first, *pages) for item in page.get("results", [])]
+        return {"count": count, "results": results[:total]}
+
+    async def iter_all_items(
+        self,
+        name: str | None = None,
+        number: str | None = None,
+        description: str | None = None,
+        category_guid: str | None = None,
+        page_size: int = 400,
+        max_items: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield every item matching a search, in order; see search_all_items."""
+        found = await self.search_all_items(
+            name=name,
+            number=number,
+            description=description,
+            category_guid=category_guid,
+            page_size=page_size,
+            max_items=max_items,
+        )
+        for item in found["results"]:
+            yield item
+
+    async def get_item(self, guid: str, include_empty_attributes: bool = False) -> dict[str, Any]:
+        """Get a single item by GUID."""
+        return await self._cached_get(f"/items/{guid}", self._item_params(include_empty_attributes))
+
+    async def get_item_bom(
+        self,
+        guid: str,
+        include_additional_attributes: bool = False,
+    ) -> dict[str, Any]:
+        """Get bill of materials for an item."""
+        return await self._cached_get(
+            f"/items/{guid}/bom", self._bom_params(include_additional_attributes)
+        )
+
+    async def get_item_where_used(self, guid: str) -> dict[str, Any]:
+        """Get assemblies where this item is used."""
+        return await self._cached_get(f"/items/{guid}/whereused")
+
+    async def get_item_revisions(self, guid: str) -> dict[str, Any]:
+        """Get all revisions for an item."""
+        return await self._cached_get(f"/items/{guid}/revisions")
+
+    async def get_item_files(self, guid: str) -> dict[str, Any]:
+        """Get files associated with an item."""
+        return await self._cached_get(f"/items/{guid}/files")
+
+    async def get_item_sourcing(
+        self,
+        guid: str,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Get sourcing/supplier relationships for an item."""
+        return await self._cached_get(f"/items/{guid}/sourcing", {"limit": limit, "offset": offset})
+
+    async def get_categories(self, path: str | None = None) -> dict[str, Any]:
+        """Get item categories."""
+        return await self._cached_get(
+            "/settings/items/categories", self._category_params(path), cache=self._category_cache
+        )
+
+    async def warm_up(self) -> None:
+        """Log in if needed and open a pooled connection, bypassing the response caches."""
+        await self._request("GET", "/settings/items/categories", extensions={"cache_disabled": True})
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self._http.aclose()
@@ -1,28 +1,78 @@
 """MCP server for Arena PLM API."""
 
+import asyncio
 import functools
 import os
+import sys
+import threading
+import warnings
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Annotated, Any, Literal
 
 from dotenv import load_dotenv
+import fastjsonschema
 import httpx
-import warnings
+import orjson
 
 from fastmcp import FastMCP
+from fastmcp.exceptions import ToolError
+from pydantic import BaseModel, Field
 from starlette.requests import Request
 from starlette.responses import Response
 
-from .arena_client import ArenaClient
+from .arena_client import ArenaClient, AsyncArenaClient
 from .auth import RestrictedGoogleProvider
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 load_dotenv()
 
 
 # Configure host/port from environment
 HOST = os.environ.get("MCP_HOST", "0.0.0.0")
 PORT = int(os.environ.get("MCP_PORT", "8080"))
-TRANSPORT = os.environ.get("MCP_TRANSPORT", "http")  # http or sse
+TRANSPORT = os.environ.get("MCP_TRANSPORT", "http")  # http, sse or stdio
 DISABLE_AUTH = os.environ.get("DISABLE_AUTH", "").lower() in ("true", "1", "yes")
 
+
+@dataclass(frozen=True, slots=True)
+class ArenaConfig:
+    """Arena credentials, parsed once from the environment.
+
+    Invalid settings are recorded in error rather than raised, so the module still
+    imports and main() can report them cleanly.
+    """
+
+    email: str | None
+    password: str | None
+    workspace_id: int | None
+    error: str | None = None
+
+    @classmethod
+    def from_env(cls) -> "ArenaConfig":
+        raw_workspace_id = os.environ.get("ARENA_WORKSPACE_ID")
+        workspace_id = error = None
+        if raw_workspace_id:
+            try:
+                workspace_id = int(raw_workspace_id)
+            except ValueError:
+                error = f"ARENA_WORKSPACE_ID must be a number, got {raw_workspace_id!r}"
+        return cls(
+            email=os.environ.get("ARENA_EMAIL") or None,
+            password=os.environ.get("ARENA_PASSWORD") or None,
+            workspace_id=workspace_id,
+            error=error,
+        )
+
+
+ARENA_CONFIG = ArenaConfig.from_env()
+
 # Configure authentication
 # When DISABLE_AUTH is true, skip auth entirely
 if DISABLE_AUTH:
@@ -40,70 +90,375 @@ else:
         extra_authorize_params={"hd": "carbonrobotics.com"},
     )
 
-mcp = FastMCP("arena-mcp-server", auth=auth)
+
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[dict[str, Any]]:
+    """Open the async client's connection pool on the server's event loop.
+
+    The async client's connections are bound to the loop that opened them, so this
+    can't happen in main() alongside the sync client's warm-up.
+    """
+    if ARENA_CONFIG.email and ARENA_CONFIG.password and not ARENA_CONFIG.error:
+        try:
+            await get_async_client().warm_up()
+        except httpx.HTTPError as e:
+            print(f"WARNING: Could not warm up async Arena client: {e}", file=sys.stderr)
+    yield {}
+
+
+mcp = FastMCP("arena-mcp-server", auth=auth, lifespan=_lifespan)
 
 client: ArenaClient | None = None
+async_client: AsyncArenaClient | None = None
+_client_lock = threading.Lock()
+
+# Max concurrent Arena requests issued by the bulk tools
+BULK_CONCURRENCY = 16
+
+# Upper bound on items returned by search_items_all
+SEARCH_ALL_CAP = 5000
+
+
+def _arena_credentials() -> tuple[str, str, int | None]:
+    """Return the configured Arena credentials, raising if they are missing."""
+    if not ARENA_CONFIG.email or not ARENA_CONFIG.password:
+        raise RuntimeError(
+            "ARENA_EMAIL and ARENA_PASSWORD environment variables required"
+        )
+    if ARENA_CONFIG.error:
+        raise RuntimeError(ARENA_CONFIG.error)
+
+    return ARENA_CONFIG.email, ARENA_CONFIG.password, ARENA_CONFIG.workspace_id
 
 
 def get_client() -> ArenaClient:
-    """Get or create authenticated Arena client."""
+    """Get or create the shared Arena client.
+
+    The client logs in on its first request (or reuses a persisted session),
+    replaces the session before Arena's idle timeout, and re-authenticates on its
+    own when Arena rejects the session with a 401.
+    """
     global client
 
-    if client is None or not client.is_authenticated:
-        client = ArenaClient()
-        email = os.environ.get("ARENA_EMAIL")
-        password = os.environ.get("ARENA_PASSWORD")
-        workspace_id = os.environ.get("ARENA_WORKSPACE_ID")
+    if client is None:
+        with _client_lock:
+            if client is None:
+                email, password, workspace_id = _arena_credentials()
+                new_client = ArenaClient()
+                new_client.set_credentials(email=email, password=password, workspace_id=workspace_id)
+                client = new_client
 
-        if not email or not password:
-            raise RuntimeError(
-                "ARENA_EMAIL and ARENA_PASSWORD environment variables required"
-            )
+    return client
 
-        client.login(
-            email=email,
-            password=password,
-            workspace_id=int(workspace_id) if workspace_id else None,
-        )
 
-    return client
+def get_async_client() -> AsyncArenaClient:
+    """Get or create the async Arena client (logs in lazily on first request).
+
+    It shares the sync client's response caches, so invalidating either clears both.
+    """
+    global async_client
+
+    if async_client is None:
+        sync_client = get_client()  # Outside the lock, which get_client() takes too
+        with _client_lock:
+            if async_client is None:
+                email, password, workspace_id = _arena_credentials()
+                new_client = AsyncArenaClient(share_cache_with=sync_client)
+                new_client.set_credentials(email=email, password=password, workspace_id=workspace_id)
+                async_client = new_client
+
+    return async_client
+
+
+async def _gather_limited(calls: Iterable[Awaitable[Any]]) -> list[Any]:
+    """Await calls concurrently, at most BULK_CONCURRENCY at a time.
+
+    Failed calls yield their exception instead of aborting the batch.
+    """
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+    async def run(call: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await call
+
+    return await asyncio.gather(*(run(call) for call in calls), return_exceptions=True)
+
+
+# Caller-facing explanations for Arena HTTP error statuses
+_HTTP_ERRORS = {
+    400: "Arena rejected the request parameters",
+    401: "Arena rejected the credentials",
+    403: "The Arena account is not permitted to access this resource",
+    404: "Not found in Arena (check the GUID)",
+    429: "Arena rate limit reached; retry shortly",
+}
 
 
-def _retry_on_auth_failure(fn):
-    """Retry once on 401 after re-authenticating with Arena."""
+def _describe_error(e: BaseException) -> str:
+    """Describe a failed Arena call in terms a tool caller can act on."""
+    if isinstance(e, httpx.HTTPStatusError):
+        status = e.response.status_code
+        reason = _HTTP_ERRORS.get(status) or (
+            "Arena is unavailable" if status >= 500 else "Arena rejected the request"
+        )
+        return f"{reason} (HTTP {status} for {e.request.url.path})"
+    if isinstance(e, httpx.TransportError):
+        return f"Could not reach Arena API ({type(e).__name__})"
+    if isinstance(e, asyncio.CancelledError):
+        return "Request was cancelled"
+    return str(e)
+
+
+def _tool_errors(fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """Report Arena HTTP and connection failures as MCP tool errors with a short explanation."""
     @functools.wraps(fn)
-    def wrapper(*args, **kwargs):
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
         try:
-            return fn(*args, **kwargs)
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return fn(*args, **kwargs)
-            raise
+            return await fn(*args, **kwargs)
+        except httpx.HTTPError as e:
+            raise ToolError(_describe_error(e)) from None
+    return wrapper
+
+
+def _run_in_thread(fn: Callable[..., str]) -> Callable[..., Awaitable[str]]:
+    """Run a blocking ArenaClient tool in a worker thread so it doesn't stall the event loop."""
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+        return await asyncio.to_thread(fn, *args, **kwargs)
     return wrapper
 
 
+OutputFormat = Literal["text", "json"]
+
+# Arena returns at most 400 results per request; bounds land in each tool's input schema
+PageLimit = Annotated[int, Field(ge=1, le=400)]
+
+
+def _render(data: Any, formatter: Callable[[Any], str], format: OutputFormat) -> str:
+    """Format an Arena response as readable text, or pass it through as compact JSON."""
+    if format == "json":
+        return orjson.dumps(data).decode()
+    return formatter(data)
+
+
+def _bulk_json(guids: list[str], results: list[Any]) -> str:
+    """Encode per-GUID results as a JSON object, reporting failures as {"error": ...}."""
+    return orjson.dumps({
+        guid: {"error": _describe_error(result)} if isinstance(result, BaseException) else result
+        for guid, result in zip(guids, results)
+    }).decode()
+
+
+# Lookup tables for formatter status labels, indexed by Arena's status codes/flags
+_REV_STATUS = ("Working", "Effective", "Superseded")
+_APPROVED = ("Not Approved", "Approved")
+_ACTIVE = ("Inactive", "Production", "Prototype", "Production, Prototype")
+
+_ITEM_TEMPLATE = (
+    "Item: {number} - {name}\n"
+    "GUID: {guid}\n"
+    "Revision: {revisionNumber}\n"
+    "Lifecycle Phase: {lifecyclePhase_name}\n"
+    "Category: {category_name}\n"
+    "Description: {description}\n"
+    "Owner: {owner_fullName}\n"
+    "Created: {creationDateTime}\n"
+    "Effective: {effectiveDateTime}"
+)
+
+
 def _format_item_summary(item: dict) -> str:
     """Format a single item as a summary line."""
-    line = f"- {item.get('number', 'N/A')}: {item.get('name', 'N/A')}"
-    if item.get("revisionNumber"):
-        line += f" (Rev {item['revisionNumber']})"
-    if item.get("lifecyclePhase", {}).get("name"):
-        line += f" [{item['lifecyclePhase']['name']}]"
-    if item.get("guid"):
-        line += f"\n  GUID: {item['guid']}"
-    if item.get("url", {}).get("app"):
-        line += f"\n  URL: {item['url']['app']}"
-    return line
+    g = item.get
+    rev = f" (Rev {r})" if (r := g("revisionNumber")) else ""
+    phase = f" [{p}]" if (lp := g("lifecyclePhase")) and (p := lp.get("name")) else ""
+    guid = f"\n  GUID: {i}" if (i := g("guid")) else ""
+    url = f"\n  URL: {u}" if (links := g("url")) and (u := links.get("app")) else ""
+    return f"- {g('number', 'N/A')}: {g('name', 'N/A')}{rev}{phase}{guid}{url}"
+
+
+# Follow-up hints appended to every non-empty search result
+_SEARCH_FOOTER = (
+    "\n\n---\n"
+    "Next steps: Use a GUID above with:\n"
+    "- get_item(guid) for full details\n"
+    "- get_item_bom(guid) to see assembly components\n"
+    "- get_item_where_used(guid) to find parent assemblies"
+)
+
+
+def _format_search_results(results: dict) -> str:
+    """Format item search results with follow-up hints."""
+    count = results.get("count", 0)
+    if count == 0:
+        return "No items found."
+
+    body = "\n".join(map(_format_item_summary, results.get("results", [])))
+    return f"Found {count} item(s):\n\n{body}{_SEARCH_FOOTER}"
+
+
+def _flatten_item(item: dict) -> defaultdict:
+    """Flatten the item fields used by _ITEM_TEMPLATE, defaulting missing ones to N/A."""
+    fields = defaultdict(lambda: "N/A", item)
+    fields["lifecyclePhase_name"] = (item.get("lifecyclePhase") or {}).get("name", "N/A")
+    fields["category_name"] = (item.get("category") or {}).get("name", "N/A")
+    fields["owner_fullName"] = (item.get("owner") or {}).get("fullName", "N/A")
+    return fields
+
+
+def _format_attribute(attr: dict) -> str:
+    """Format a custom attribute as an indented name/value line."""
+    g = attr.get
+    return f"  {g('name', 'N/A')}: {g('value', 'N/A')}"
+
+
+def _format_item(item: dict) -> str:
+    """Format full item details."""
+    url = f"\nURL: {u}" if (u := (item.get("url") or {}).get("app")) else ""
+    attrs = item.get("additionalAttributes")
+    attrs = (
+        "\n\nCustom Attributes:\n" + "\n".join(map(_format_attribute, attrs))
+        if attrs else ""
+    )
+    return f"{_ITEM_TEMPLATE.format_map(_flatten_item(item))}{url}{attrs}"
+
+
+def _format_bom_line(bom_line: dict) -> str:
+    """Format a single BOM line."""
+    g = bom_line.get
+    ig = (g("item") or {}).get
+    ref_des = f" RefDes: {r}" if (r := g("refDes")) else ""
+    return (
+        f"[{g('lineNumber', 'N/A')}] {ig('number', 'N/A')}: "
+        f"{ig('name', 'N/A')} (Qty: {g('quantity', 'N/A')}){ref_des}\n"
+        f"     GUID: {ig('guid', 'N/A')}"
+    )
+
+
+def _format_bom(results: dict) -> str:
+    """Format BOM lines with quantities and reference designators."""
+    count = results.get("count", 0)
+    if count == 0:
+        return "No BOM lines found (item may not be an assembly)."
+
+    body = "\n".join(map(_format_bom_line, results.get("results", [])))
+    return f"BOM has {count} line(s):\n\n{body}"
+
+
+def _format_usage(usage: dict) -> str:
+    """Format a single where-used assembly reference."""
+    g = usage.get
+    ig = (g("item") or {}).get
+    return (
+        f"- {ig('number', 'N/A')}: {ig('name', 'N/A')} "
+        f"(Line {g('lineNumber', 'N/A')}, Qty: {g('quantity', 'N/A')})\n"
+        f"  GUID: {ig('guid', 'N/A')}"
+    )
+
+
+def _format_where_used(results: dict) -> str:
+    """Format the assemblies an item is used in."""
+    count = results.get("count", 0)
+    if count == 0:
+        return "Item is not used in any assemblies."
+
+    body = "\n".join(map(_format_usage, results.get("results", [])))
+    return f"Used in {count} assembly(ies):\n\n{body}"
+
+
+def _format_revision(rev: dict) -> str:
+    """Format a single revision."""
+    g = rev.get
+    status = g("status")
+    in_range = isinstance(status, int) and 0 <= status < len(_REV_STATUS)
+    status = _REV_STATUS[status] if in_range else "Unknown"
+    change = f" (via {c})" if (ch := g("change")) and (c := ch.get("number")) else ""
+    return (
+        f"- Rev {g('number', 'Working')} [{status}] - "
+        f"{(g('lifecyclePhase') or {}).get('name', 'N/A')}{change}\n"
+        f"  GUID: {g('guid', 'N/A')}"
+    )
+
+
+def _format_revisions(results: dict) -> str:
+    """Format item revision history."""
+    count = results.get("count", 0)
+    if count == 0:
+        return "No revisions found."
+
+    body = "\n".join(map(_format_revision, results.get("results", [])))
+    return f"Found {count} revision(s):\n\n{body}"
+
+
+def _format_file(file_assoc: dict) -> str:
+    """Format a single file association."""
+    fg = (file_assoc.get("file") or {}).get
+    title = f" - {t}" if (t := fg("title")) else ""
+    primary = " [PRIMARY]" if file_assoc.get("primary") else ""
+    return (
+        f"- {fg('name', 'N/A')} ({fg('format', 'N/A')}){title}\n"
+        f"  Number: {fg('number', 'N/A')}, Edition: {fg('edition', 'N/A')}{primary}"
+    )
+
+
+def _format_files(results: dict) -> str:
+    """Format files associated with an item."""
+    count = results.get("count", 0)
+    if count == 0:
+        return "No files associated with this item."
+
+    body = "\n".join(map(_format_file, results.get("results", [])))
+    return f"Found {count} file(s):\n\n{body}"
+
+
+def _format_source(source: dict) -> str:
+    """Format a single sourcing relationship."""
+    g = source.get
+    approved = _APPROVED[bool(g("approved"))]
+    active = _ACTIVE[bool(g("activeProduction")) | bool(g("activePrototype")) << 1]
+    notes = f"\n  Notes: {n}" if (n := g("notes")) else ""
+    return f"- [{approved}] [{active}]{notes}\n  GUID: {g('guid', 'N/A')}"
+
+
+def _format_sourcing(results: dict) -> str:
+    """Format sourcing relationships with approval and activity status."""
+    count = results.get("count", 0)
+    if count == 0:
+        return "No sourcing relationships found."
+
+    body = "\n".join(map(_format_source, results.get("results", [])))
+    return f"Found {count} source(s):\n\n{body}"
+
+
+def _format_category(cat: dict) -> str:
+    """Format a single category."""
+    g = cat.get
+    assignable = "assignable" if g("assignable") else "structural"
+    description = f"\n  Description: {d}" if (d := g("description")) else ""
+    return f"- {g('path', 'N/A')} [{assignable}]\n  GUID: {g('guid', 'N/A')}{description}"
+
+
+def _format_categories(results: dict) -> str:
+    """Format item categories."""
+    count = results.get("count", 0)
+    if count == 0:
+        return "No categories found."
+
+    body = "\n".join(map(_format_category, results.get("results", [])))
+    return f"Found {count} category(ies):\n\n{body}"
 
 
 @mcp.tool()
-@_retry_on_auth_failure
+@_tool_errors
+@_run_in_thread
 def search_items(
     name: str | None = None,
     number: str | None = None,
     description: str | None = None,
     category_guid: str | None = None,
-    limit: int = 20,
+    limit: PageLimit = 20,
+    format: OutputFormat = "text",
 ) -> str:
     """Search for items in Arena PLM by name, number, or description.
 
@@ -118,6 +473,7 @@ def search_items(
         description: Filter by description (partial match)
         category_guid: Filter by category GUID (use get_categories to find GUIDs)
         limit: Max results to return (default 20, max 400)
+        format: "text" (default) for readable output, or "json" for the raw Arena response
     """
     arena = get_client()
     results = arena.search_items(
@@ -127,29 +483,55 @@ def search_items(
         category_guid=category_guid,
         limit=limit,
     )
+    return _render(results, _format_search_results, format)
 
-    count = results.get("count", 0)
-    items = results.get("results", [])
 
-    if count == 0:
-        return "No items found."
+@mcp.tool()
+@_tool_errors
+async def search_items_all(
+    name: str | None = None,
+    number: str | None = None,
+    description: str | None = None,
+    category_guid: str | None = None,
+    max_items: Annotated[int, Field(ge=1, le=SEARCH_ALL_CAP)] = 1000,
+    format: OutputFormat = "text",
+) -> str:
+    """Search for all matching items, beyond the 400-result limit of search_items.
 
-    lines = [f"Found {count} item(s):\n"]
-    for item in items:
-        lines.append(_format_item_summary(item))
+    Fetches result pages concurrently. Use for full-catalog scans such as listing
+    every item in a category; prefer search_items for quick lookups.
 
-    lines.append("\n---")
-    lines.append("Next steps: Use a GUID above with:")
-    lines.append("- get_item(guid) for full details")
-    lines.append("- get_item_bom(guid) to see assembly components")
-    lines.append("- get_item_where_used(guid) to find parent assemblies")
+    Args:
+        name: Filter by item name (partial match)
+        number: Filter by item number (partial match)
+        description: Filter by description (partial match)
+        category_guid: Filter by category GUID (use get_categories to find GUIDs)
+        max_items: Max results to return (default 1000, max 5000)
+        format: "text" (default) for readable output, or "json" for the matching items
+            ("count" is the total number of matches)
+    """
+    arena = get_async_client()
+    found = await arena.search_all_items(
+        name=name,
+        number=number,
+        description=description,
+        category_guid=category_guid,
+        max_items=max_items,
+    )
+    if format == "json":
+        return orjson.dumps(found).decode()
 
-    return "\n".join(lines)
+    count, items = found["count"], found["results"]
+    text = _format_search_results({"count": len(items), "results": items})
+    if count > len(items):
+        text += f"\n\nStopped at max_items={max_items}; {count} items match in total."
+    return text
 
 
 @mcp.tool()
-@_retry_on_auth_failure
-def get_item(guid: str) -> str:
+@_tool_errors
+@_run_in_thread
+def get_item(guid: str, format: OutputFormat = "text") -> str:
     """Get full details for a specific item by its GUID.
 
     Returns all item attributes including custom attributes, description, owner, and lifecycle phase.
@@ -157,36 +539,97 @@ def get_item(guid: str) -> str:
 
     Args:
         guid: Item GUID (obtain from search_items)
+        format: "text" (default) for readable output, or "json" for the raw Arena response
     """
     arena = get_client()
-    item = arena.get_item(guid)
+    return _render(arena.get_item(guid), _format_item, format)
 
-    lines = [
-        f"Item: {item.get('number', 'N/A')} - {item.get('name', 'N/A')}",
-        f"GUID: {item.get('guid', 'N/A')}",
-        f"Revision: {item.get('revisionNumber', 'N/A')}",
-        f"Lifecycle Phase: {item.get('lifecyclePhase', {}).get('name', 'N/A')}",
-        f"Category: {item.get('category', {}).get('name', 'N/A')}",
-        f"Description: {item.get('description', 'N/A')}",
-        f"Owner: {item.get('owner', {}).get('fullName', 'N/A')}",
-        f"Created: {item.get('creationDateTime', 'N/A')}",
-        f"Effective: {item.get('effectiveDateTime', 'N/A')}",
-    ]
 
-    if item.get("url", {}).get("app"):
-        lines.append(f"URL: {item['url']['app']}")
+@mcp.tool()
+@_tool_errors
+async def get_item_full(guid: str, format: OutputFormat = "text") -> str:
+    """Get an item's details, BOM, where-used, revisions, files, and sourcing in one call.
+
+    Fetches all sections concurrently, so prefer this over calling each tool in turn
+    when you need a complete picture of a part. A section that fails to load is
+    reported as an error without discarding the others.
 
-    if item.get("additionalAttributes"):
-        lines.append("\nCustom Attributes:")
-        for attr in item["additionalAttributes"]:
-            lines.append(f"  {attr.get('name', 'N/A')}: {attr.get('value', 'N/A')}")
+    Args:
+        guid: Item GUID (obtain from search_items)
+        format: "text" (default) for readable output, or "json" for the raw Arena
+            responses keyed by section
+    """
+    arena = get_async_client()
+    item, bom, where_used, revisions, files, sourcing = await asyncio.gather(
+        arena.get_item(guid),
+        arena.get_item_bom(guid),
+        arena.get_item_where_used(guid),
+        arena.get_item_revisions(guid),
+        arena.get_item_files(guid),
+        arena.get_item_sourcing(guid),
+        return_exceptions=True,
+    )
+    if isinstance(item, BaseException):
+        # Nothing useful to show without the item itself
+        raise ToolError(_describe_error(item)) from None
+
+    if format == "json":
+        return orjson.dumps({
+            key: {"error": _describe_error(data)} if isinstance(data, BaseException) else data
+            for key, data in (
+                ("item", item),
+                ("bom", bom),
+                ("whereUsed", where_used),
+                ("revisions", revisions),
+                ("files", files),
+                ("sourcing", sourcing),
+            )
+        }).decode()
 
-    return "\n".join(lines)
+    sections = [_format_item(item)]
+    for title, data, formatter in (
+        ("BOM", bom, _format_bom),
+        ("Where Used", where_used, _format_where_used),
+        ("Revisions", revisions, _format_revisions),
+        ("Files", files, _format_files),
+        ("Sourcing", sourcing, _format_sourcing),
+    ):
+        body = f"Error: {_describe_error(data)}" if isinstance(data, BaseException) else formatter(data)
+        sections.append(f"\n## {title}\n{body}")
+    return "\n".join(sections)
 
 
 @mcp.tool()
-@_retry_on_auth_failure
-def get_item_bom(guid: str) -> str:
+@_tool_errors
+async def get_items_bulk(guids: list[str], format: OutputFormat = "text") -> str:
+    """Get summaries for many items at once by GUID.
+
+    Fetches items concurrently, so prefer this over calling get_item repeatedly
+    (e.g., for every GUID returned by search_items).
+
+    Args:
+        guids: Item GUIDs (obtain from search_items)
+        format: "text" (default) for readable output, or "json" for the raw Arena
+            responses keyed by GUID
+    """
+    arena = get_async_client()
+    guids = list(dict.fromkeys(guids))
+    items = await _gather_limited(arena.get_item(guid) for guid in guids)
+    if format == "json":
+        return _bulk_json(guids, items)
+
+    body = "\n".join([
+        f"- {guid}: Error: {_describe_error(item)}" if isinstance(item, BaseException)
+        else _format_item_summary(item)
+        for guid, item in zip(guids, items)
+    ])
+    return f"Fetched {len(guids)} item(s):\n\n{body}"
+
+
+@mcp.tool()
+@_tool_errors
+@_run_in_thread
+def get_item_bom(guid: str, format: OutputFormat = "text") -> str:
     """Get the bill of materials (BOM) for an assembly item.
 
     Returns all child components with quantities and reference designators.
@@ -195,37 +638,42 @@ def get_item_bom(guid: str) -> str:
 
     Args:
         guid: Item GUID of the assembly
+        format: "text" (default) for readable output, or "json" for the raw Arena response
     """
     arena = get_client()
-    results = arena.get_item_bom(guid)
+    return _render(arena.get_item_bom(guid), _format_bom, format)
 
-    count = results.get("count", 0)
-    bom_lines = results.get("results", [])
 
-    if count == 0:
-        return "No BOM lines found (item may not be an assembly)."
+@mcp.tool()
+@_tool_errors
+async def get_boms_bulk(guids: list[str], format: OutputFormat = "text") -> str:
+    """Get the bills of materials for many assemblies at once.
 
-    lines = [f"BOM has {count} line(s):\n"]
-    for bom_line in bom_lines:
-        item = bom_line.get("item", {})
-        line_num = bom_line.get("lineNumber", "N/A")
-        qty = bom_line.get("quantity", "N/A")
-        ref_des = bom_line.get("refDes", "")
+    Fetches BOMs concurrently; useful for expanding several levels of an assembly
+    without calling get_item_bom for each sub-assembly in turn.
 
-        lines.append(
-            f"[{line_num}] {item.get('number', 'N/A')}: {item.get('name', 'N/A')} "
-            f"(Qty: {qty})"
-        )
-        if ref_des:
-            lines[-1] += f" RefDes: {ref_des}"
-        lines.append(f"     GUID: {item.get('guid', 'N/A')}")
+    Args:
+        guids: Item GUIDs of the assemblies
+        format: "text" (default) for readable output, or "json" for the raw Arena
+            responses keyed by GUID
+    """
+    arena = get_async_client()
+    guids = list(dict.fromkeys(guids))
+    boms = await _gather_limited(arena.get_item_bom(guid) for guid in guids)
+    if format == "json":
+        return _bulk_json(guids, boms)
 
-    return "\n".join(lines)
+    return "\n\n".join([
+        f"## {guid}\nError: {_describe_error(bom)}" if isinstance(bom, BaseException)
+        else f"## {guid}\n{_format_bom(bom)}"
+        for guid, bom in zip(guids, boms)
+    ])
 
 
 @mcp.tool()
-@_retry_on_auth_failure
-def get_item_where_used(guid: str) -> str:
+@_tool_errors
+@_run_in_thread
+def get_item_where_used(guid: str, format: OutputFormat = "text") -> str:
     """Find all assemblies where a given item is used as a component.
 
     Essential for impact analysis - shows what products would be affected by a part change.
@@ -233,34 +681,16 @@ def get_item_where_used(guid: str) -> str:
 
     Args:
         guid: Item GUID to find usage of
+        format: "text" (default) for readable output, or "json" for the raw Arena response
     """
     arena = get_client()
-    results = arena.get_item_where_used(guid)
-
-    count = results.get("count", 0)
-    usages = results.get("results", [])
-
-    if count == 0:
-        return "Item is not used in any assemblies."
-
-    lines = [f"Used in {count} assembly(ies):\n"]
-    for usage in usages:
-        item = usage.get("item", {})
-        line_num = usage.get("lineNumber", "N/A")
-        qty = usage.get("quantity", "N/A")
-
-        lines.append(
-            f"- {item.get('number', 'N/A')}: {item.get('name', 'N/A')} "
-            f"(Line {line_num}, Qty: {qty})"
-        )
-        lines.append(f"  GUID: {item.get('guid', 'N/A')}")
-
-    return "\n".join(lines)
+    return _render(arena.get_item_where_used(guid), _format_where_used, format)
 
 
 @mcp.tool()
-@_retry_on_auth_failure
-def get_item_revisions(guid: str) -> str:
+@_tool_errors
+@_run_in_thread
+def get_item_revisions(guid: str, format: OutputFormat = "text") -> str:
     """Get all revisions of an item including working, effective, and superseded revisions.
 
     Shows revision history with associated change orders.
@@ -268,68 +698,32 @@ def get_item_revisions(guid: str) -> str:
 
     Args:
         guid: Item GUID
+        format: "text" (default) for readable output, or "json" for the raw Arena response
     """
     arena = get_client()
-    results = arena.get_item_revisions(guid)
-
-    count = results.get("count", 0)
-    revisions = results.get("results", [])
-
-    if count == 0:
-        return "No revisions found."
-
-    status_map = {0: "Working", 1: "Effective", 2: "Superseded"}
-    lines = [f"Found {count} revision(s):\n"]
-    for rev in revisions:
-        status = status_map.get(rev.get("status"), "Unknown")
-        rev_num = rev.get("number", "Working")
-        phase = rev.get("lifecyclePhase", {}).get("name", "N/A")
-
-        lines.append(f"- Rev {rev_num} [{status}] - {phase}")
-        if rev.get("change", {}).get("number"):
-            lines[-1] += f" (via {rev['change']['number']})"
-        lines.append(f"  GUID: {rev.get('guid', 'N/A')}")
-
-    return "\n".join(lines)
+    return _render(arena.get_item_revisions(guid), _format_revisions, format)
 
 
 @mcp.tool()
-@_retry_on_auth_failure
-def get_item_files(guid: str) -> str:
+@_tool_errors
+@_run_in_thread
+def get_item_files(guid: str, format: OutputFormat = "text") -> str:
     """Get all files associated with an item (drawings, datasheets, CAD files, etc.).
 
     Use to find documentation or design files for a part.
 
     Args:
         guid: Item GUID
+        format: "text" (default) for readable output, or "json" for the raw Arena response
     """
     arena = get_client()
-    results = arena.get_item_files(guid)
-
-    count = results.get("count", 0)
-    files = results.get("results", [])
-
-    if count == 0:
-        return "No files associated with this item."
-
-    lines = [f"Found {count} file(s):\n"]
-    for file_assoc in files:
-        f = file_assoc.get("file", {})
-        lines.append(
-            f"- {f.get('name', 'N/A')} ({f.get('format', 'N/A')})"
-        )
-        if f.get("title"):
-            lines[-1] += f" - {f['title']}"
-        lines.append(f"  Number: {f.get('number', 'N/A')}, Edition: {f.get('edition', 'N/A')}")
-        if file_assoc.get("primary"):
-            lines[-1] += " [PRIMARY]"
-
-    return "\n".join(lines)
+    return _render(arena.get_item_files(guid), _format_files, format)
 
 
 @mcp.tool()
-@_retry_on_auth_failure
-def get_item_sourcing(guid: str, limit: int = 20) -> str:
+@_tool_errors
+@_run_in_thread
+def get_item_sourcing(guid: str, limit: PageLimit = 20, format: OutputFormat = "text") -> str:
     """Get supplier/sourcing information for an item including approved manufacturers and vendors.
 
     Shows approval status and whether sources are active for production or prototype.
@@ -338,34 +732,16 @@ def get_item_sourcing(guid: str, limit: int = 20) -> str:
     Args:
         guid: Item GUID
         limit: Max results to return (default 20, max 400)
+        format: "text" (default) for readable output, or "json" for the raw Arena response
     """
     arena = get_client()
-    results = arena.get_item_sourcing(guid, limit=limit)
-
-    count = results.get("count", 0)
-    sources = results.get("results", [])
-
-    if count == 0:
-        return "No sourcing relationships found."
-
-    lines = [f"Found {count} source(s):\n"]
-    for source in sources:
-        approved = "Approved" if source.get("approved") else "Not Approved"
-        prod = "Production" if source.get("activeProduction") else ""
-        proto = "Prototype" if source.get("activePrototype") else ""
-        active = ", ".join(filter(None, [prod, proto])) or "Inactive"
-
-        lines.append(f"- [{approved}] [{active}]")
-        if source.get("notes"):
-            lines.append(f"  Notes: {source['notes']}")
-        lines.append(f"  GUID: {source.get('guid', 'N/A')}")
-
-    return "\n".join(lines)
+    return _render(arena.get_item_sourcing(guid, limit=limit), _format_sourcing, format)
 
 
 @mcp.tool()
-@_retry_on_auth_failure
-def get_categories(path: str | None = None) -> str:
+@_tool_errors
+@_run_in_thread
+def get_categories(path: str | None = None, format: OutputFormat = "text") -> str:
     """Get available item categories.
 
     Returns category GUIDs that can be used to filter search_items results.
@@ -373,25 +749,120 @@ def get_categories(path: str | None = None) -> str:
 
     Args:
         path: Filter by category path prefix (e.g., 'item\\Assembly')
+        format: "text" (default) for readable output, or "json" for the raw Arena response
     """
     arena = get_client()
-    results = arena.get_categories(path=path)
+    return _render(arena.get_categories(path=path), _format_categories, format)
+
+
+# Tools batch_execute may dispatch to
+_BATCH_TOOLS = (
+    "search_items",
+    "search_items_all",
+    "get_item",
+    "get_item_full",
+    "get_items_bulk",
+    "get_item_bom",
+    "get_boms_bulk",
+    "get_item_where_used",
+    "get_item_revisions",
+    "get_item_files",
+    "get_item_sourcing",
+    "get_categories",
+)
+
+# Tool name -> (function, compiled input schema validator), built once on first use
+_batch_handlers: dict[str, tuple[Callable[..., Awaitable[str]], Callable[[Any], Any]]] | None = None
+_batch_handlers_lock = asyncio.Lock()
+
+
+async def _get_batch_handlers() -> dict[str, tuple[Callable[..., Awaitable[str]], Callable[[Any], Any]]]:
+    """Build the batch_execute handler table, once even if first calls arrive together."""
+    global _batch_handlers
+
+    if _batch_handlers is None:
+        async with _batch_handlers_lock:
+            if _batch_handlers is None:
+                handlers = {}
+                for tool_name in _BATCH_TOOLS:
+                    tool = await mcp.get_tool(tool_name)
+                    validate = fastjsonschema.compile(tool.parameters, use_default=False)
+                    handlers[tool_name] = (tool.fn, validate)
+                _batch_handlers = handlers
+
+    return _batch_handlers
+
+
+async def _batch_tool_fn(name: str, arguments: dict[str, Any]) -> Callable[..., Awaitable[str]]:
+    """Look up a tool that batch_execute may call and validate its arguments.
+
+    batch_execute calls tool functions directly, bypassing FastMCP's own argument
+    validation, so each tool's input schema is checked here instead.
+    """
+    handler = (await _get_batch_handlers()).get(name)
+    if handler is None:
+        raise ValueError(f"Unknown or non-batchable tool: {name}")
 
-    count = results.get("count", 0)
-    categories = results.get("results", [])
+    fn, validate = handler
+    try:
+        validate(arguments)
+    except fastjsonschema.JsonSchemaValueException as e:
+        raise ValueError(f"Invalid arguments: {e.message}") from None
+    return fn
 
-    if count == 0:
-        return "No categories found."
 
-    lines = [f"Found {count} category(ies):\n"]
-    for cat in categories:
-        assignable = "assignable" if cat.get("assignable") else "structural"
-        lines.append(f"- {cat.get('path', 'N/A')} [{assignable}]")
-        lines.append(f"  GUID: {cat.get('guid', 'N/A')}")
-        if cat.get("description"):
-            lines.append(f"  Description: {cat['description']}")
+class BatchOperation(BaseModel):
+    """A single tool call for batch_execute."""
 
-    return "\n".join(lines)
+    tool: str = Field(description="Name of the tool to call, e.g. get_item_bom")
+    arguments: dict[str, Any] = Field(default_factory=dict, description="Arguments for the tool")
+
+
+@mcp.tool()
+async def batch_execute(
+    operations: list[BatchOperation],
+    max_concurrent: Annotated[int, Field(ge=1, le=BULK_CONCURRENCY)] = 8,
+    stop_on_error: bool = False,
+) -> str:
+    """Run several tool calls in a single request, concurrently.
+
+    Each operation is {"tool": <tool name>, "arguments": {...}}, for example
+    {"tool": "get_item_bom", "arguments": {"guid": "..."}}.
+    Use to look up many parts at once instead of calling tools one at a time.
+    Results are returned in the same order as the operations.
+
+    Args:
+        operations: Tool calls to run, each with "tool" and "arguments" keys
+        max_concurrent: Max operations running at once (default 8, max 16)
+        stop_on_error: Skip operations that have not started once one fails
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    failed = asyncio.Event()
+
+    async def run(operation: BatchOperation) -> str:
+        name = operation.tool
+        arguments = operation.arguments
+
+        async with semaphore:
+            if stop_on_error and failed.is_set():
+                return "Skipped: an earlier operation failed"
+            try:
+                fn = await _batch_tool_fn(name, arguments)
+                return await fn(**arguments)
+            except Exception:
+                failed.set()
+                raise
+
+    results = await asyncio.gather(*(run(op) for op in operations), return_exceptions=True)
+
+    sections = []
+    for i, (operation, result) in enumerate(zip(operations, results), 1):
+        if isinstance(result, BaseException):
+            result = f"Error: {_describe_error(result)}"
+        arguments = orjson.dumps(operation.arguments).decode()
+        sections.append(f"## [{i}] {operation.tool} {arguments}\n{result}")
+
+    return "\n\n".join(sections)
 
 
 @mcp.custom_route("/healthz", methods=["GET"])
@@ -402,21 +873,47 @@ def health_check(_request: Request) -> Response:
 
 def main() -> None:
     """Run the MCP server."""
-    # Validate required Arena credentials at startup
-    arena_email = os.environ.get("ARENA_EMAIL")
-    arena_password = os.environ.get("ARENA_PASSWORD")
+    # With stdio transport, stdout carries the MCP protocol, so status output goes to stderr
+    stdio = TRANSPORT == "stdio"
+    out = sys.stderr if stdio else sys.stdout
 
-    if not arena_email or not arena_password:
-        print("ERROR: Missing required environment variables")
-        print("ARENA_EMAIL and ARENA_PASSWORD must be set")
-        print("\nPlease configure these in your .env file or environment")
+    # Validate required Arena credentials at startup
+    if not ARENA_CONFIG.email or not ARENA_CONFIG.password:
+        print("ERROR: Missing required environment variables", file=out)
+        print("ARENA_EMAIL and ARENA_PASSWORD must be set", file=out)
+        print("\nPlease configure these in your .env file or environment", file=out)
+        raise SystemExit(1)
+    if ARENA_CONFIG.error:
+        print(f"ERROR: {ARENA_CONFIG.error}", file=out)
         raise SystemExit(1)
 
     auth_status = "DISABLED" if DISABLE_AUTH else "enabled"
-    print(f"Starting Arena MCP server on http://{HOST}:{PORT}")
-    print(f"Transport: {TRANSPORT}, Auth: {auth_status}")
-    print(f"Arena account: {arena_email}")
-    mcp.run(transport=TRANSPORT, host=HOST, port=PORT)
+    location = "stdio" if stdio else f"http://{HOST}:{PORT}"
+    print(f"Starting Arena MCP server on {location}", file=out)
+    print(f"Transport: {TRANSPORT}, Auth: {auth_status}", file=out)
+    print(f"Arena account: {ARENA_CONFIG.email}", file=out)
+
+    # Log in and open a pooled connection now so the first tool call doesn't pay for it
+    try:
+        get_client().get_categories()
+    except httpx.HTTPStatusError as e:
+        print(f"ERROR: Arena rejected startup request ({e.response.status_code})", file=out)
+        print("Check ARENA_EMAIL, ARENA_PASSWORD and ARENA_WORKSPACE_ID", file=out)
+        raise SystemExit(1)
+    except httpx.HTTPError as e:
+        print(f"ERROR: Could not reach Arena API: {e}", file=out)
+        raise SystemExit(1)
+
+    # Faster event loop for the async client's concurrent requests
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    if stdio:
+        # The stdio transport writes each message as one fully assembled line and
+        # flushes once per message, so no extra stdout buffering is needed
+        mcp.run(transport="stdio")
+    else:
+        mcp.run(transport=TRANSPORT, host=HOST, port=PORT)
 
 
 if __name__ == "__main__":